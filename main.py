@@ -8,31 +8,39 @@ Created for: ofthebones.xyz leaderboards
 """
 
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 import mysql.connector
+import mysql.connector.pooling
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import asyncio
-from threading import Thread
-from flask import Flask
+import concurrent.futures
+import functools
+import logging
+from aiohttp import web
 import time
 
 # ============================================================================
 # BOT CONFIGURATION
 # ============================================================================
 
-last_leaderboard_time = 0
-COOLDOWN_SECONDS = 300
+# Logger for the bot - per-interaction details are DEBUG, so production (INFO) stays quiet
+log = logging.getLogger("gy")
 
-# Simple web server for Render health checks
-app = Flask(__name__)
+COOLDOWN_SECONDS = 300  # !graveyard can be used once per server every 5 minutes
 
-@app.route('/')
-def health():
-    return "Bot is running!"
+# Simple web server for Render health checks (runs on the bot's own event loop)
+async def health(request):
+    return web.Response(text="Bot is running!")
 
-def run_web():
-    app.run(host='0.0.0.0', port=int(os.environ.get('PORT', 5000)))
+async def start_web() -> web.AppRunner:
+    """Starts the health check server on $PORT and returns its runner"""
+    app = web.Application()
+    app.router.add_get('/', health)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, host='0.0.0.0', port=int(os.environ.get('PORT', 5000))).start()
+    return runner
 
 # Bot settings - these control how the bot behaves
 BOT_PREFIX = "!"  # Commands start with ! (like !graveyard)
@@ -45,9 +53,50 @@ DATABASE_CONFIG = {
     'user': 'ucghqjnsgrb03',                # Your database username
     'password': os.getenv('DB_PASSWORD'),    # Password from environment variable (secure!)
     'charset': 'utf8mb4',                   # Character encoding for emojis/special chars
-    'autocommit': True                      # Automatically save database queries
+    'autocommit': True,                     # Automatically save database queries
+    'use_pure': False                       # Use the faster C extension for decoding rows
 }
 
+# Connection pool settings - connections are opened once and reused
+POOL_NAME = "gy"
+POOL_SIZE = 8
+
+# The shared connection pool (created on first use, retried until the database is reachable)
+db_pool = None
+_POOL_LOCK = asyncio.Lock()
+
+# The pool raises an error instead of waiting when every connection is in use,
+# so callers wait here for a free connection first
+_POOL_SLOTS = asyncio.Semaphore(POOL_SIZE)
+
+# Worker threads just for database calls - one per pooled connection, so a query
+# never waits behind unrelated work in asyncio's default executor
+DB_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix="db")
+
+# Prepared-statement cursors for each pooled connection:
+# id(underlying connection) -> (that connection, server connection id, {query name: cursor})
+# Each pooled connection prepares a query once and reuses it
+_PREPARED_CURSORS: Dict[int, Tuple[Any, int, Dict[str, Any]]] = {}
+
+# Leaderboard cache settings - results are reused for this many seconds
+# before the database is asked again
+CACHE_TTL = 60
+CACHE_REFRESH_SECONDS = 50  # Refresh a bit before entries expire so clicks never wait
+LEADERBOARD_LIMIT = 10  # Number of players shown per leaderboard
+
+# One player row as it comes from the database: (nickname, kills, levels_reached)
+PlayerRow = Tuple[str, int, int]
+
+# Cached leaderboards: leaderboard key -> (time fetched, formatted lines)
+_CACHE: Dict[str, Tuple[float, List[str]]] = {}
+
+# One lock per leaderboard so simultaneous clicks share a single query
+_CACHE_LOCKS: Dict[str, asyncio.Lock] = {}
+
+# Finished embeds: leaderboard key -> (time the lines were fetched, embed dict)
+# An entry is only used while it matches the lines currently in _CACHE
+_EMBED_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
 # ============================================================================
 # LEADERBOARD DEFINITIONS
 # ============================================================================
@@ -62,49 +111,107 @@ LEADERBOARDS = {
         "name": "Playa3ull",
         "table": "3ull_tournament_leaderboard",
         "join_users": False,
+        "name_column": "user_id",  # 3ull table has user_id column with usernames
     },
     "dragon": {
         "name": "Ancient Dragon Alliance", 
         "table": "leaderboard_dragon",
         "join_users": False,
+        "name_column": "username",
     },
     "gingerbread": {
         "name": "Gingerbread Squad",
         "table": "leaderboard_gingerbread", 
         "join_users": False,
+        "name_column": "username",
     },
     "promo": {
         "name": "Promo Facie",
         "table": "leaderboard_promo",
-        "join_users": False, 
+        "join_users": False,
+        "name_column": "username",
     },
     "squeak": {
         "name": "World of Squeak",
         "table": "leaderboard_squeak",
         "join_users": False,
+        "name_column": "username",
     },
     "algo apes": {
         "name": "Algo Apes",
         "table": "algoapes_tournament_leaderboard",
         "join_users": False,
+        "name_column": "username",
     },
     "CSB": {
         "name": "Stake Bulls",
         "table": "leaderboard_csb",
         "join_users": False,
+        "name_column": "username",
     },
     "ARC": {
         "name": "Aping Riot",
         "table": "leaderboard_arc",
         "join_users": False,
+        "name_column": "username",
     },
     "banker labs": {
         "name": "Banker Labs",
         "table": "leaderboard_bank",
         "join_users": False,
+        "name_column": "username",
     }
 }
 
+# Every leaderboard table has this (levels_reached, kills, name) index -
+# see migrations/001_leaderboard_order_index.sql
+LEADERBOARD_INDEX = "ix_lb_order"
+
+def build_leaderboard_query(config: Dict[str, Any]) -> str:
+    """
+    Builds the final SQL for one leaderboard.
+    The only parameter left is the LIMIT, so the statement can be prepared once.
+    The index hint lets MySQL read the top rows straight from the index
+    and stop after LIMIT rows instead of sorting the whole table.
+    """
+    
+    if config["join_users"]:
+        # For general leaderboard - need to join with Users table to get nicknames
+        return """
+            SELECT u.nickname, l.kills, l.levels_reached
+            FROM {} l FORCE INDEX ({})
+            JOIN Users u ON l.user_id = u.user_id  
+            ORDER BY l.levels_reached DESC, l.kills DESC
+            LIMIT %s
+        """.format(config["table"], LEADERBOARD_INDEX)
+    
+    # For tournament leaderboards - the player name column depends on the table
+    return """
+        SELECT {} as nickname, kills, levels_reached
+        FROM {} FORCE INDEX ({})
+        ORDER BY levels_reached DESC, kills DESC  
+        LIMIT %s
+    """.format(config["name_column"], config["table"], LEADERBOARD_INDEX)
+
+# Store the final SQL with each leaderboard so queries just look it up
+for config in LEADERBOARDS.values():
+    config["sql"] = build_leaderboard_query(config)
+
+# Every leaderboard in one round trip - each row is tagged with its leaderboard key.
+# Takes one LIMIT parameter per leaderboard, in LEADERBOARDS order.
+WARM_SQL = " UNION ALL ".join(
+    "SELECT '{}' AS lb, nickname, kills, levels_reached FROM ({}) t".format(key, config["sql"])
+    for key, config in LEADERBOARDS.items()
+) + " ORDER BY levels_reached DESC, kills DESC"
+WARM_QUERY_NAME = "warm"  # Name of WARM_SQL in the prepared cursor cache
+
+# These never change while the bot runs, so build them once at startup
+_DROPDOWN_OPTIONS = [
+    discord.SelectOption(label=config["name"], value=key)  # Clean label without emoji processing
+    for key, config in LEADERBOARDS.items()
+]
+_NAMES_JOINED = "\n".join(config["name"] for config in LEADERBOARDS.values())  # No emojis
+
 # ============================================================================
 # BOT SETUP
 # ============================================================================
@@ -113,8 +220,25 @@ LEADERBOARDS = {
 intents = discord.Intents.default()
 intents.message_content = True  # Allow bot to read message content
 
+class LeaderboardBot(commands.Bot):
+    """
+    The bot, plus the health check web server that lives alongside it.
+    """
+    
+    web_runner = None
+    
+    async def setup_hook(self):
+        """Runs once before connecting to Discord - starts the health check server"""
+        self.web_runner = await start_web()
+    
+    async def close(self):
+        """Stops the health check server when the bot shuts down"""
+        if self.web_runner:
+            await self.web_runner.cleanup()
+        await super().close()
+
 # Create the bot
-bot = commands.Bot(
+bot = LeaderboardBot(
     command_prefix=BOT_PREFIX,
     description=BOT_DESCRIPTION, 
     intents=intents
@@ -124,89 +248,267 @@ bot = commands.Bot(
 # DATABASE CONNECTION FUNCTIONS
 # ============================================================================
 
+def create_database_pool():
+    """
+    Creates the shared MySQL connection pool.
+    Connections are opened once here and reused for every query,
+    so a dropdown click doesn't pay for a fresh login each time.
+    
+    Returns:
+        MySQLConnectionPool object or None if failed
+    """
+    try:
+        return mysql.connector.pooling.MySQLConnectionPool(
+            pool_name=POOL_NAME,
+            pool_size=POOL_SIZE,
+            pool_reset_session=False,  # Keep prepared statements when a connection is returned
+            **DATABASE_CONFIG
+        )
+    except mysql.connector.Error as error:
+        log.error("❌ Database pool creation failed: %s", error)
+        return None
+
+async def run_db(func, *args):
+    """
+    Runs a blocking database call on DB_EXECUTOR and waits for the result
+    without blocking the bot's event loop.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(DB_EXECUTOR, functools.partial(func, *args))
+
+async def get_database_pool():
+    """
+    Returns the shared pool, creating it if it doesn't exist yet.
+    If the database was down when we last tried, this tries again,
+    so the bot recovers by itself once MySQL is back.
+    
+    Returns:
+        MySQLConnectionPool object or None if the database is still unreachable
+    """
+    global db_pool
+    if db_pool is None:
+        async with _POOL_LOCK:
+            # Another caller may have created it while we waited for the lock
+            if db_pool is None:
+                db_pool = await run_db(create_database_pool)
+    return db_pool
+
 async def get_database_connection():
     """
-    Creates a connection to the MySQL database.
+    Borrows a connection from the shared pool, waiting if all are in use.
+    Call release_database_connection() when done - this hands it back to the pool.
+    The pool pings each connection as it hands it out and reconnects dead ones,
+    so callers don't need their own is_connected()/ping() check.
     This function handles errors gracefully so the bot doesn't crash.
     
     Returns:
-        mysql.connector connection object or None if failed
+        pooled mysql.connector connection object or None if failed
     """
+    pool = await get_database_pool()
+    if pool is None:
+        return None
+    
+    await _POOL_SLOTS.acquire()
     try:
-        connection = mysql.connector.connect(**DATABASE_CONFIG)
+        connection = await run_db(pool.get_connection)
         return connection
     except mysql.connector.Error as error:
-        print(f"❌ Database connection failed: {error}")
+        _POOL_SLOTS.release()
+        log.error("❌ Database connection failed: %s", error)
         return None
 
-async def fetch_leaderboard_data(leaderboard_key: str, limit: int = 10) -> List[Dict[str, Any]]:
+async def release_database_connection(connection):
+    """
+    Hands a borrowed connection back to the pool
+    (closing a pooled connection returns it instead of disconnecting).
+    """
+    try:
+        await run_db(connection.close)
+    finally:
+        _POOL_SLOTS.release()
+
+def get_prepared_cursor(connection, query_name: str):
     """
-    Fetches leaderboard data from the database.
+    Returns this connection's prepared cursor for a query
+    (a leaderboard key or WARM_QUERY_NAME), creating it the first time
+    the connection runs that query.
+    Cursors belong to the pooled connection object itself, so they are never
+    handed to a different connection.
     """
     
-    # Get leaderboard configuration
-    config = LEADERBOARDS.get(leaderboard_key)
-    if not config:
-        print(f"❌ No config found for key: {leaderboard_key}")
-        return []
+    # The real connection behind the pool's wrapper - the pool reuses these objects
+    cnx = connection._cnx
+    entry = _PREPARED_CURSORS.get(id(cnx))
+    if entry is None or entry[0] is not cnx or entry[1] != cnx.connection_id:
+        # First use, or the pool reconnected it - the old statements died with the session
+        entry = (cnx, cnx.connection_id, {})
+        _PREPARED_CURSORS[id(cnx)] = entry
+    
+    cursors = entry[2]
+    cursor = cursors.get(query_name)
+    if cursor is None:
+        # Plain tuple rows - no per-row dict to build and throw away
+        cursor = cnx.cursor(prepared=True)
+        cursors[query_name] = cursor
+    return cursor
+
+def drop_prepared_cursors(connection):
+    """
+    Forgets every prepared cursor made on a connection (e.g. after it failed).
+    Call this before the connection is handed back to the pool.
+    """
+    
+    _PREPARED_CURSORS.pop(id(connection._cnx), None)
+
+def run_prepared_query(connection, query_name: str, query: str, params: Tuple) -> List[Tuple]:
+    """
+    Executes a prepared query and reads every row.
+    This blocks on the network, so call it through run_db.
+    """
+    
+    cursor = get_prepared_cursor(connection, query_name)
+    cursor.execute(query, params)
+    return cursor.fetchall()
+
+def run_leaderboard_query(connection, leaderboard_key: str, limit: int) -> List[str]:
+    """
+    Executes a leaderboard's prepared query and formats each row as it is read,
+    without collecting the raw rows into a list first.
+    This blocks on the network, so call it through run_db.
+    """
+    
+    cursor = get_prepared_cursor(connection, leaderboard_key)
+    cursor.execute(LEADERBOARDS[leaderboard_key]["sql"], (limit,))
+    return [format_leaderboard_row(i, row) for i, row in enumerate(cursor, 1)]
+
+async def query_leaderboard_lines(leaderboard_key: str, limit: int) -> Optional[List[str]]:
+    """
+    Runs the leaderboard query against the database.
+    
+    Returns:
+        list of formatted leaderboard lines, or None if the database couldn't be reached
+    """
     
     # Connect to database
     connection = await get_database_connection()
     if not connection:
-        print(f"❌ Database connection failed for {leaderboard_key}")
-        return []
+        log.error("❌ Database connection failed for %s", leaderboard_key)
+        return None
     
     try:
-        cursor = connection.cursor(dictionary=True)
-        
-        if config["join_users"]:
-            # For general leaderboard - need to join with Users table to get nicknames
-            query = """
-                SELECT u.nickname, l.kills, l.levels_reached
-                FROM {} l
-                JOIN Users u ON l.user_id = u.user_id  
-                ORDER BY l.levels_reached DESC, l.kills DESC
-                LIMIT %s
-            """.format(config["table"])
-        else:
-            # For tournament leaderboards - check table structure
-            if leaderboard_key == "3ull":
-                # 3ull table has user_id column with usernames
-                query = """
-                    SELECT user_id as nickname, kills, levels_reached
-                    FROM {}
-                    ORDER BY levels_reached DESC, kills DESC  
-                    LIMIT %s
-                """.format(config["table"])
-            else:
-                # Other tournament tables have username column
-                query = """
-                    SELECT username as nickname, kills, levels_reached
-                    FROM {}
-                    ORDER BY levels_reached DESC, kills DESC  
-                    LIMIT %s
-                """.format(config["table"])
-        
-        print(f"🔍 Executing query for {leaderboard_key}: {query}")
-        cursor.execute(query, (limit,))
-        results = cursor.fetchall()
-        print(f"📊 Found {len(results)} results for {leaderboard_key}")
+        log.debug("🔍 Executing query for %s", leaderboard_key)
+        # Run the query in a worker thread so the bot keeps handling Discord events
+        results = await run_db(run_leaderboard_query, connection, leaderboard_key, limit)
+        log.debug("📊 Found %d results for %s", len(results), leaderboard_key)
         
         return results
         
     except mysql.connector.Error as error:
-        print(f"❌ Database query failed for {leaderboard_key}: {error}")
+        log.error("❌ Database query failed for %s: %s", leaderboard_key, error)
+        # The statements on this connection may be gone - prepare them again next time
+        drop_prepared_cursors(connection)
+        return None
+    finally:
+        # Return the connection to the pool
+        # (the prepared cursor stays open for the next query)
+        await release_database_connection(connection)
+
+async def fetch_leaderboard_lines(leaderboard_key: str, limit: int = LEADERBOARD_LIMIT) -> List[str]:
+    """
+    Fetches the formatted leaderboard lines, reusing recent results from the cache.
+    Only the standard top-N view is cached; other limits always hit the database.
+    """
+    
+    # Get leaderboard configuration
+    config = LEADERBOARDS.get(leaderboard_key)
+    if not config:
+        log.warning("❌ No config found for key: %s", leaderboard_key)
         return []
+    
+    if limit != LEADERBOARD_LIMIT:
+        return await query_leaderboard_lines(leaderboard_key, limit) or []
+    
+    lock = _CACHE_LOCKS.setdefault(leaderboard_key, asyncio.Lock())
+    async with lock:
+        # Serve from cache if the results are still fresh
+        fetched_at, lines = _CACHE.get(leaderboard_key, (0, None))
+        if lines is not None and time.time() - fetched_at < CACHE_TTL:
+            return lines
+        
+        results = await query_leaderboard_lines(leaderboard_key, limit)
+        if results is None:
+            # Don't cache failures - try the database again next time
+            return []
+        
+        _CACHE[leaderboard_key] = (time.time(), results)
+        return results
+
+async def warm_leaderboard_cache() -> bool:
+    """
+    Loads every leaderboard into the cache with a single query,
+    so nobody has to wait on the database for their first click.
+    
+    Returns:
+        True if the cache was filled, False if the database couldn't be reached
+    """
+    
+    connection = await get_database_connection()
+    if not connection:
+        log.error("❌ Database connection failed while warming the cache")
+        return False
+    
+    try:
+        params = (LEADERBOARD_LIMIT,) * len(LEADERBOARDS)
+        rows = await run_db(run_prepared_query, connection, WARM_QUERY_NAME, WARM_SQL, params)
+    except mysql.connector.Error as error:
+        log.error("❌ Cache warm query failed: %s", error)
+        drop_prepared_cursors(connection)
+        return False
     finally:
-        if connection.is_connected():
-            cursor.close()
-            connection.close()
+        await release_database_connection(connection)
+    
+    # Split the combined rows back out per leaderboard (they arrive already sorted)
+    # Each row is (lb, nickname, kills, levels_reached)
+    buckets: Dict[str, List[str]] = {key: [] for key in LEADERBOARDS}
+    for row in rows:
+        lines = buckets[row[0]]
+        lines.append(format_leaderboard_row(len(lines) + 1, row[1:]))
+    
+    fetched_at = time.time()
+    for key, results in buckets.items():
+        _CACHE[key] = (fetched_at, results)
+    
+    log.info("📊 Cached %d results across %d leaderboards", len(rows), len(buckets))
+    return True
+
+@tasks.loop(seconds=CACHE_REFRESH_SECONDS)
+async def refresh_leaderboard_cache():
+    """
+    Keeps every leaderboard in the cache fresh in the background,
+    so dropdown clicks (including the first after a restart) skip the database.
+    """
+    try:
+        # warm_leaderboard_cache logs why it failed, so there's nothing more to report here
+        await warm_leaderboard_cache()
+    except Exception:
+        # Don't let one bad refresh stop the loop - try again next time
+        log.exception("❌ Cache refresh failed")
 
 # ============================================================================
 # DISCORD EMBED CREATION
 # ============================================================================
 
-def create_leaderboard_embed(leaderboard_key: str, data: List[Dict[str, Any]]) -> discord.Embed:
+# Clean format for one leaderboard line: number, name, waves, kills (with commas)
+LEADERBOARD_ROW = "{}. **{}** - {} waves survived, {:,} enemies destroyed"
+
+def format_leaderboard_row(position: int, row: PlayerRow) -> str:
+    """
+    Formats one player row as a numbered leaderboard line (no medal emojis).
+    """
+    nickname, kills, levels_reached = row
+    return LEADERBOARD_ROW.format(position, nickname, levels_reached, kills)
+
+def create_leaderboard_embed(leaderboard_key: str, lines: List[str]) -> discord.Embed:
     """
     Creates a clean Discord embed showing leaderboard data.
     """
@@ -222,25 +524,62 @@ def create_leaderboard_embed(leaderboard_key: str, data: List[Dict[str, Any]]) -
     # Clean footer
     embed.set_footer(text="Graveyard Antics TD")
     
-    if not data:
+    if not lines:
         embed.description = "No players found in this leaderboard."
         return embed
     
-    # Create clean numbered leaderboard
-    leaderboard_text = ""
+    # Use description instead of add_field to avoid subtitle
+    embed.description = "\n".join(lines)
     
-    for i, player in enumerate(data, 1):
-        # Simple numbering - no medal emojis
-        kills_formatted = f"{player['kills']:,}"
-        
-        # Clean format: number, name, stats
-        leaderboard_text += f"{i}. **{player['nickname']}** - {player['levels_reached']} waves survived, {kills_formatted} enemies destroyed\n"
+    return embed
+
+def create_main_menu_embed() -> discord.Embed:
+    """
+    Creates the main menu embed listing every leaderboard.
+    """
     
-    # Use description instead of add_field to avoid subtitle
-    embed.description = leaderboard_text
+    embed = discord.Embed(
+        title="🏆 Graveyard Antics TD Leaderboards 🏆",
+        description="Select a leaderboard from the dropdown menu below to view the top 10 players & scores for that leaderboard",
+        color=0x000000  # Black color to match
+    )
+    
+    embed.add_field(
+        name="Available Leaderboards", 
+        value=_NAMES_JOINED,
+        inline=False
+    )
+    
+    embed.set_footer(text="Graveyard Antics TD | Menu expires in 5 minutes")
     
     return embed
 
+# The main menu never changes, so build it once
+_MAIN_MENU_EMBED = create_main_menu_embed().to_dict()
+
+async def get_leaderboard_embed(leaderboard_key: str) -> discord.Embed:
+    """
+    Returns the embed for a leaderboard, reusing the already-built one
+    while its cached lines haven't changed.
+    """
+    
+    lines = await fetch_leaderboard_lines(leaderboard_key)
+    
+    cached = _CACHE.get(leaderboard_key)
+    if cached is None or cached[1] is not lines:
+        # Lines didn't come from the cache (e.g. database error) - don't store
+        return create_leaderboard_embed(leaderboard_key, lines)
+    
+    data_version = cached[0]
+    embed_version, embed_dict = _EMBED_CACHE.get(leaderboard_key, (None, None))
+    if embed_version == data_version:
+        # Build a fresh Embed from the stored dict so a shared one is never mutated
+        return discord.Embed.from_dict(embed_dict)
+    
+    embed = create_leaderboard_embed(leaderboard_key, lines)
+    _EMBED_CACHE[leaderboard_key] = (data_version, embed.to_dict())
+    return embed
+
 # ============================================================================
 # DROPDOWN MENU CLASS
 # ============================================================================
@@ -252,21 +591,12 @@ class LeaderboardDropdown(discord.ui.Select):
     """
     
     def __init__(self):
-        # Create options for each leaderboard
-        options = []
-        for key, config in LEADERBOARDS.items():
-            options.append(
-                discord.SelectOption(
-                    label=config["name"],  # Clean label without emoji processing
-                    value=key
-                )
-            )
-        
+        # Options are prebuilt - copy the list so this menu can't change the shared one
         super().__init__(
             placeholder="Choose a leaderboard to view...",
             min_values=1,
             max_values=1,
-            options=options
+            options=list(_DROPDOWN_OPTIONS)
         )
     
     async def callback(self, interaction: discord.Interaction):
@@ -274,43 +604,33 @@ class LeaderboardDropdown(discord.ui.Select):
         This function runs when someone selects an option from the dropdown.
         It fetches the data and shows the leaderboard.
         """
-        print(f"🔄 Dropdown callback triggered for: {self.values[0]}")
-        print(f"🔄 Interaction ID: {interaction.id}")
-        print(f"🔄 User: {interaction.user}")
+        log.debug("🔄 Dropdown callback triggered for %s (interaction %s, user %s)",
+                  self.values[0], interaction.id, interaction.user)
     
         try:
             # Show "thinking" message while we fetch data
-            print("🔄 About to defer interaction...")
             await interaction.response.defer()
-            print("✅ Interaction deferred successfully")
         
             # Get the selected leaderboard
             selected_leaderboard = self.values[0]
-            print(f"🔄 Processing leaderboard: {selected_leaderboard}")
+            log.debug("🔄 Processing leaderboard: %s", selected_leaderboard)
         
-            # Fetch data from database
-            data = await fetch_leaderboard_data(selected_leaderboard)
-            print(f"🔄 Got {len(data)} records from database")
-        
-            # Create embed with the data
-            embed = create_leaderboard_embed(selected_leaderboard, data)
-            print("🔄 Created embed")
+            # Fetch data and build (or reuse) the embed
+            embed = await get_leaderboard_embed(selected_leaderboard)
         
             # Send the leaderboard
-            print("🔄 About to send followup...")
             await interaction.followup.send(embed=embed, ephemeral=False)
-            print(f"✅ Sent leaderboard for: {selected_leaderboard}")
+            log.debug("✅ Sent leaderboard for: %s", selected_leaderboard)
         
         except Exception as e:
-            print(f"❌ Error in callback: {e}")
-            print(f"❌ Error type: {type(e)}")
+            log.exception("❌ Error in callback: %s", e)
             try:
                 if not interaction.response.is_done():
                     await interaction.response.send_message("❌ Something went wrong!", ephemeral=True)
                 else:
                     await interaction.followup.send("❌ Something went wrong!", ephemeral=True)
             except:
-                print("❌ Could not send error message")
+                log.error("❌ Could not send error message")
 
 class LeaderboardView(discord.ui.View):
     """
@@ -318,11 +638,8 @@ class LeaderboardView(discord.ui.View):
     """
     
     def __init__(self):
-        print("🔧 Creating LeaderboardView...")
         super().__init__(timeout=300)  # Menu expires in 5 minutes
-        print("🔧 Adding dropdown to view...")
         self.add_item(LeaderboardDropdown())
-        print("✅ LeaderboardView created successfully")
     
     async def on_timeout(self):
         """Called when the menu expires"""
@@ -335,55 +652,42 @@ class LeaderboardView(discord.ui.View):
 # ============================================================================
 
 @bot.command(name='graveyard', aliases=['gy'])
+@commands.cooldown(1, COOLDOWN_SECONDS, commands.BucketType.guild)
 async def leaderboards_command(ctx):
     """
     Main command that users type: !graveyard
     This shows the dropdown menu to select which leaderboard to view.
+    The cooldown is checked before this runs, so spammed commands do no work.
     
     Args:
         ctx: Discord context (contains info about who sent the command, where, etc.)
     """
-    global last_leaderboard_time
-    
-    current_time = time.time()
-    
-    # Check if cooldown is still active
-    if current_time - last_leaderboard_time < COOLDOWN_SECONDS:
-        remaining_time = COOLDOWN_SECONDS - (current_time - last_leaderboard_time)
-        minutes = int(remaining_time // 60)
-        seconds = int(remaining_time % 60)
-        
-        await ctx.send(f"Leaderboard is cooling down. Try again in {minutes}m {seconds}s.")
-        return
-    
-    # Update the last command time
-    last_leaderboard_time = current_time
-    
-    print(f"🎯 !graveyard command triggered by {ctx.author}")
-    
-    # Create embed for the main menu
-    embed = discord.Embed(
-        title="🏆 Graveyard Antics TD Leaderboards 🏆",
-        description="Select a leaderboard from the dropdown menu below to view the top 10 players & scores for that leaderboard",
-        color=0x000000  # Black color to match
-    )
+    log.debug("🎯 !graveyard command triggered by %s", ctx.author)
     
-    embed.add_field(
-        name="Available Leaderboards", 
-        value="\n".join([config['name'] for config in LEADERBOARDS.values()]),  # No emojis
-        inline=False
-    )
-    
-    embed.set_footer(text="Graveyard Antics TD | Menu expires in 5 minutes")
+    # Main menu embed is prebuilt - make a fresh copy to send
+    embed = discord.Embed.from_dict(_MAIN_MENU_EMBED)
     
     # Create the dropdown view
-    print("🎯 Creating dropdown view...")
     view = LeaderboardView()
     
     # Send the message with dropdown
-    print("🎯 Sending message with dropdown...")
     await ctx.send(embed=embed, view=view)
-    print("✅ Message sent successfully")
+    log.debug("✅ Menu sent to %s", ctx.author)
+
+@leaderboards_command.error
+async def leaderboards_command_error(ctx, error):
+    """
+    Tells the user how long is left when the command is cooling down.
+    """
+    if isinstance(error, commands.CommandOnCooldown):
+        minutes = int(error.retry_after // 60)
+        seconds = int(error.retry_after % 60)
+        
+        await ctx.send(f"Leaderboard is cooling down. Try again in {minutes}m {seconds}s.")
+        return
+    
+    # This handler replaces discord.py's default one, so keep the traceback
+    log.error("❌ Command error in %s: %s", ctx.command, error, exc_info=error)
 
 # ============================================================================
 # BOT EVENTS
@@ -395,19 +699,15 @@ async def on_ready():
     This runs when the bot successfully connects to Discord.
     It's like the bot saying "I'm online and ready!"
     """
-    print(f'✅ Bot is ready!')
-    print(f'📊 Logged in as: {bot.user.name}')
-    print(f'🆔 Bot ID: {bot.user.id}')
-    print(f'🎯 Loaded {len(LEADERBOARDS)} leaderboards')
-    print('🚀 Bot is now online and ready to serve leaderboards!')
-    
-    # Test database connection on startup
-    connection = await get_database_connection()
-    if connection:
-        print('✅ Database connection successful!')
-        connection.close()
-    else:
-        print('❌ Database connection failed!')
+    log.info('✅ Bot is ready!')
+    log.info('📊 Logged in as: %s', bot.user.name)
+    log.info('🆔 Bot ID: %s', bot.user.id)
+    log.info('🎯 Loaded %d leaderboards', len(LEADERBOARDS))
+    log.info('🚀 Bot is now online and ready to serve leaderboards!')
+    
+    # Load every leaderboard now and keep them fresh (the first run happens immediately)
+    if not refresh_leaderboard_cache.is_running():
+        refresh_leaderboard_cache.start()
 
 # Temporarily disabled error handler to debug double embeds
 # @bot.event
@@ -430,26 +730,32 @@ async def on_ready():
 # RUN THE BOT
 # ============================================================================
 
-Thread(target=run_web, daemon=True).start()
 if __name__ == "__main__":
     """
     This is where the bot actually starts running.
     It gets the bot token from environment variables for security.
     """
     
+    # Log level comes from the environment (e.g. LOG_LEVEL=DEBUG for troubleshooting)
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO"),
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    
     # Get bot token from environment variable
     bot_token = os.getenv('DISCORD_BOT_TOKEN')
     
     if not bot_token:
-        print("❌ Error: DISCORD_BOT_TOKEN environment variable not set!")
-        print("Please set your Discord bot token in the environment variables.")
+        log.error("❌ Error: DISCORD_BOT_TOKEN environment variable not set!")
+        log.error("Please set your Discord bot token in the environment variables.")
         exit(1)
     
     if not os.getenv('DB_PASSWORD'):
-        print("❌ Error: DB_PASSWORD environment variable not set!")
-        print("Please set your database password in the environment variables.")
+        log.error("❌ Error: DB_PASSWORD environment variable not set!")
+        log.error("Please set your database password in the environment variables.")
         exit(1)
     
     # Start the bot
-    print("🚀 Starting Discord Leaderboard Bot...")
-    bot.run(bot_token)
+    log.info("🚀 Starting Discord Leaderboard Bot...")
+    # log_handler=None - discord.py's logs go through the logging set up above
+    bot.run(bot_token, log_handler=None)
@@ -0,0 +1,24 @@
+-- Index every leaderboard table in the order the bot reads it.
+--
+-- The bot asks for the top players with
+--   ORDER BY levels_reached DESC, kills DESC LIMIT 10
+-- and hints FORCE INDEX (ix_lb_order). With this index MySQL scans it
+-- backwards and stops after 10 rows instead of sorting the whole table.
+-- The name column is included so the query is answered from the index alone.
+--
+-- Run this once against the database BEFORE deploying the bot:
+-- the queries fail if the index is missing.
+--
+-- The general leaderboard joins Users on user_id, which is the Users
+-- primary key, so Users needs no extra index.
+
+CREATE INDEX ix_lb_order ON Leaderboard (levels_reached, kills, user_id);
+CREATE INDEX ix_lb_order ON 3ull_tournament_leaderboard (levels_reached, kills, user_id);
+CREATE INDEX ix_lb_order ON leaderboard_dragon (levels_reached, kills, username);
+CREATE INDEX ix_lb_order ON leaderboard_gingerbread (levels_reached, kills, username);
+CREATE INDEX ix_lb_order ON leaderboard_promo (levels_reached, kills, username);
+CREATE INDEX ix_lb_order ON leaderboard_squeak (levels_reached, kills, username);
+CREATE INDEX ix_lb_order ON algoapes_tournament_leaderboard (levels_reached, kills, username);
+CREATE INDEX ix_lb_order ON leaderboard_csb (levels_reached, kills, username);
+CREATE INDEX ix_lb_order ON leaderboard_arc (levels_reached, kills, username);
+CREATE INDEX ix_lb_order ON leaderboard_bank (levels_reached, kills, username);